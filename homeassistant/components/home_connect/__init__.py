@@ -8,18 +8,21 @@ from requests import HTTPError
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
+from homeassistant.const import (
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_DEVICE,
+    CONF_SCAN_INTERVAL,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_entry_oauth2_flow, config_validation as cv
-from homeassistant.util import Throttle
+from homeassistant.helpers.event import async_track_time_interval
 
 from . import api, config_flow
-from .const import DOMAIN, OAUTH2_AUTHORIZE, OAUTH2_TOKEN
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, OAUTH2_AUTHORIZE, OAUTH2_TOKEN
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(minutes=1)
-
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
@@ -32,7 +35,7 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
-PLATFORMS = ["binary_sensor", "light", "sensor", "switch"]
+PLATFORMS = ("binary_sensor", "light", "sensor", "switch")
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -71,10 +74,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await update_all_devices(hass, entry)
 
-    for component in PLATFORMS:
-        hass.async_create_task(
+    set_update_interval(hass, entry)
+    entry.add_update_listener(async_options_updated)
+
+    await asyncio.gather(
+        *[
             hass.config_entries.async_forward_entry_setup(entry, component)
-        )
+            for component in PLATFORMS
+        ]
+    )
 
     return True
 
@@ -90,19 +98,46 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hc_api = hass.data[DOMAIN].pop(entry.entry_id)
+        if hc_api.unsub_timer:
+            hc_api.unsub_timer()
 
     return unload_ok
 
 
-@Throttle(SCAN_INTERVAL)
+def set_update_interval(hass, entry):
+    """(Re)schedule the periodic device refresh from the entry options."""
+    hc_api = hass.data[DOMAIN][entry.entry_id]
+    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+
+    async def _async_update(now=None):
+        """Poll the appliances for fresh state."""
+        await update_all_devices(hass, entry)
+
+    if hc_api.unsub_timer is not None:
+        hc_api.unsub_timer()
+    hc_api.unsub_timer = async_track_time_interval(
+        hass, _async_update, timedelta(seconds=scan_interval)
+    )
+
+
+async def async_options_updated(hass, entry):
+    """Handle config entry options update."""
+    set_update_interval(hass, entry)
+
+
 async def update_all_devices(hass, entry):
     """Update all the devices."""
     data = hass.data[DOMAIN]
     hc_api = data[entry.entry_id]
+
     try:
         await hass.async_add_executor_job(hc_api.get_devices)
-        for device_dict in hc_api.devices:
-            await hass.async_add_executor_job(device_dict["device"].initialize)
+        await asyncio.gather(
+            *[
+                hass.async_add_executor_job(device_dict[CONF_DEVICE].initialize)
+                for device_dict in hc_api.devices
+            ]
+        )
     except HTTPError as err:
         _LOGGER.warning("Cannot update devices: %s", err.response.status_code)
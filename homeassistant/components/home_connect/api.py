@@ -37,6 +37,12 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+PROGRAM_SENSORS = {
+    "Remaining Program Time": (None, None, DEVICE_CLASS_TIMESTAMP, 1),
+    "Duration": (TIME_SECONDS, "mdi:update", None, 1),
+    "Program Progress": (PERCENTAGE, "mdi:progress-clock", None, 1),
+}
+
 
 class ConfigEntryAuth(homeconnect.HomeConnectAPI):
     """Provide Home Connect authentication tied to an OAuth2 based config entry."""
@@ -55,6 +61,7 @@ class ConfigEntryAuth(homeconnect.HomeConnectAPI):
         )
         super().__init__(self.session.token)
         self.devices = []
+        self.unsub_timer = None
 
     def refresh_tokens(self) -> dict:
         """Refresh and return new Home Connect tokens using Home Assistant OAuth2 session."""
@@ -67,30 +74,24 @@ class ConfigEntryAuth(homeconnect.HomeConnectAPI):
     def get_devices(self):
         """Get a dictionary of devices."""
         appl = self.get_appliances()
+        known_devices = {
+            device_dict[CONF_DEVICE].appliance.haId: device_dict
+            for device_dict in self.devices
+        }
         devices = []
         for app in appl:
-            if app.type == "Dryer":
-                device = Dryer(self.hass, app)
-            elif app.type == "Washer":
-                device = Washer(self.hass, app)
-            elif app.type == "Dishwasher":
-                device = Dishwasher(self.hass, app)
-            elif app.type == "FridgeFreezer":
-                device = FridgeFreezer(self.hass, app)
-            elif app.type == "Oven":
-                device = Oven(self.hass, app)
-            elif app.type == "CoffeeMaker":
-                device = CoffeeMaker(self.hass, app)
-            elif app.type == "Hood":
-                device = Hood(self.hass, app)
-            elif app.type == "Hob":
-                device = Hob(self.hass, app)
-            else:
-                _LOGGER.warning("Appliance type %s not implemented", app.type)
-                continue
-            devices.append(
-                {CONF_DEVICE: device, CONF_ENTITIES: device.get_entity_info()}
-            )
+            device_dict = known_devices.get(app.haId)
+            if device_dict is None:
+                device_class = APPLIANCE_TYPES.get(app.type)
+                if device_class is None:
+                    _LOGGER.warning("Appliance type %s not implemented", app.type)
+                    continue
+                device = device_class(self.hass, app)
+                device_dict = {
+                    CONF_DEVICE: device,
+                    CONF_ENTITIES: device.get_entity_info(),
+                }
+            devices.append(device_dict)
         self.devices = devices
         return devices
 
@@ -106,6 +107,7 @@ class HomeConnectDevice:
         """Initialize the device class."""
         self.hass = hass
         self.appliance = appliance
+        self._listening = False
 
     def initialize(self):
         """Fetch the info needed to initialize the device."""
@@ -126,13 +128,16 @@ class HomeConnectDevice:
             self.appliance.status[BSH_ACTIVE_PROGRAM] = {
                 ATTR_VALUE: program_active[ATTR_KEY]
             }
-        self.appliance.listen_events(callback=self.event_callback)
+        if not self._listening:
+            self.appliance.listen_events(callback=self.event_callback)
+            self._listening = True
 
     def event_callback(self, appliance):
         """Handle event."""
-        _LOGGER.debug("Update triggered on %s", appliance.name)
-        _LOGGER.debug(self.appliance.status)
-        dispatcher_send(self.hass, SIGNAL_UPDATE_ENTITIES, appliance.haId)
+        _LOGGER.debug(
+            "Update triggered on %s: %s", appliance.name, self.appliance.status
+        )
+        dispatcher_send(self.hass, f"{SIGNAL_UPDATE_ENTITIES}-{appliance.haId}")
 
 
 class DeviceWithPrograms(HomeConnectDevice):
@@ -158,11 +163,6 @@ class DeviceWithPrograms(HomeConnectDevice):
         There will be one of the four types of sensors for each
         device.
         """
-        sensors = {
-            "Remaining Program Time": (None, None, DEVICE_CLASS_TIMESTAMP, 1),
-            "Duration": (TIME_SECONDS, "mdi:update", None, 1),
-            "Program Progress": (PERCENTAGE, "mdi:progress-clock", None, 1),
-        }
         return [
             {
                 ATTR_DEVICE: self,
@@ -173,7 +173,7 @@ class DeviceWithPrograms(HomeConnectDevice):
                 ATTR_DEVICE_CLASS: device_class,
                 ATTR_SIGN: sign,
             }
-            for k, (unit, icon, device_class, sign) in sensors.items()
+            for k, (unit, icon, device_class, sign) in PROGRAM_SENSORS.items()
         ]
 
 
@@ -517,3 +517,15 @@ class Hob(DeviceWithOpState, DeviceWithPrograms, DeviceWithRemoteControl):
             "switch": program_switches,
             "sensor": program_sensors + op_state_sensor,
         }
+
+
+APPLIANCE_TYPES = {
+    "CoffeeMaker": CoffeeMaker,
+    "Dishwasher": Dishwasher,
+    "Dryer": Dryer,
+    "FridgeFreezer": FridgeFreezer,
+    "Hob": Hob,
+    "Hood": Hood,
+    "Oven": Oven,
+    "Washer": Washer,
+}
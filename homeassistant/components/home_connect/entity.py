@@ -25,15 +25,16 @@ class HomeConnectEntity(Entity):
         """Register callbacks."""
         self.async_on_remove(
             async_dispatcher_connect(
-                self.hass, SIGNAL_UPDATE_ENTITIES, self._update_callback
+                self.hass,
+                f"{SIGNAL_UPDATE_ENTITIES}-{self.device.appliance.haId}",
+                self._update_callback,
             )
         )
 
     @callback
-    def _update_callback(self, ha_id):
+    def _update_callback(self):
         """Update data."""
-        if ha_id == self.device.appliance.haId:
-            self.async_entity_update()
+        self.async_entity_update()
 
     @property
     def should_poll(self):
@@ -163,9 +163,10 @@ class HomeConnectLight(HomeConnectEntity, LightEntity):
 
     async def async_update(self):
         """Update the light's status."""
-        if self.device.appliance.status.get(self._key, {}).get(ATTR_VALUE) is True:
+        light_state = self.device.appliance.status.get(self._key, {}).get(ATTR_VALUE)
+        if light_state is True:
             self._state = True
-        elif self.device.appliance.status.get(self._key, {}).get(ATTR_VALUE) is False:
+        elif light_state is False:
             self._state = False
         else:
             self._state = None
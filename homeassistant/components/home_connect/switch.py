@@ -128,19 +128,14 @@ class HomeConnectPowerSwitch(HomeConnectEntity, SwitchEntity):
 
     async def async_update(self):
         """Update the switch's status."""
-        if (
-            self.device.appliance.status.get(BSH_POWER_STATE, {}).get(ATTR_VALUE)
-            == BSH_POWER_ON
-        ):
+        status = self.device.appliance.status
+        power_state = status.get(BSH_POWER_STATE, {}).get(ATTR_VALUE)
+        operation_state = status.get(BSH_OPERATION_STATE, {}).get(ATTR_VALUE)
+        if power_state == BSH_POWER_ON:
             self._state = True
-        elif (
-            self.device.appliance.status.get(BSH_POWER_STATE, {}).get(ATTR_VALUE)
-            == self.device.power_off_state
-        ):
+        elif power_state == self.device.power_off_state:
             self._state = False
-        elif self.device.appliance.status.get(BSH_OPERATION_STATE, {}).get(
-            ATTR_VALUE, None
-        ) in [
+        elif operation_state in [
             "BSH.Common.EnumType.OperationState.Ready",
             "BSH.Common.EnumType.OperationState.DelayedStart",
             "BSH.Common.EnumType.OperationState.Run",
@@ -150,10 +145,7 @@ class HomeConnectPowerSwitch(HomeConnectEntity, SwitchEntity):
             "BSH.Common.EnumType.OperationState.Finished",
         ]:
             self._state = True
-        elif (
-            self.device.appliance.status.get(BSH_OPERATION_STATE, {}).get(ATTR_VALUE)
-            == "BSH.Common.EnumType.OperationState.Inactive"
-        ):
+        elif operation_state == "BSH.Common.EnumType.OperationState.Inactive":
             self._state = False
         else:
             self._state = None